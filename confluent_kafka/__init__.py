@@ -3,6 +3,7 @@ from .cimpl import (Consumer,  # noqa
                     KafkaError,
                     KafkaException,
                     Message,
+                    PreparedHeaders,
                     Producer,
                     TopicPartition,
                     libversion,
@@ -44,6 +45,45 @@ class ThrottleEvent (object):
         return "{}/{} throttled for {} ms".format(self.broker_name, self.broker_id, int(self.throttle_time * 1000))
 
 
+class MessageBatch (object):
+    """
+    MessageBatch contains a batch of consumed messages returned by
+    :py:func:`Consumer.consume_batch()`, laid out as parallel lists
+    where index ``i`` of every list refers to the same message.
+
+    An application must check ``errors[i]`` to see if the entry is a
+    proper message (``None``) or an error/event, as with :py:func:`Message.error()`.
+
+    This class is typically not user instantiated.
+
+    :ivar list(str) topics: Topic name of each message
+    :ivar list(int) partitions: Partition of each message
+    :ivar list(int) offsets: Offset of each message (negative if not available)
+    :ivar list(int) timestamps: Timestamp of each message in milliseconds since epoch (UTC),
+                                or -1 if not available
+    :ivar list(int) timestamp_types: Timestamp type of each message, one of ``TIMESTAMP_NOT_AVAILABLE``,
+                                     ``TIMESTAMP_CREATE_TIME`` or ``TIMESTAMP_LOG_APPEND_TIME``
+                                     as returned by :py:func:`Message.timestamp()`
+    :ivar list(bytes) keys: Key of each message (None if not set)
+    :ivar list(bytes) values: Value (payload) of each message (None if not set)
+    :ivar list(KafkaError) errors: Error of each message (None for proper messages)
+    """
+    def __init__(self, topics, partitions, offsets, timestamps,
+                 timestamp_types, keys, values, errors):
+
+        self.topics = topics
+        self.partitions = partitions
+        self.offsets = offsets
+        self.timestamps = timestamps
+        self.timestamp_types = timestamp_types
+        self.keys = keys
+        self.values = values
+        self.errors = errors
+
+    def __len__(self):
+        return len(self.offsets)
+
+
 def _resolve_plugins(plugins):
     """ Resolve embedded plugins from the wheel's library directory.
 
@@ -24,10 +24,15 @@ class AvroProducer(Producer):
                             and the standard Kafka client configuration (``bootstrap.servers`` et.al).
         :param str default_key_schema: Optional default avro schema for key
         :param str default_value_schema: Optional default avro schema for value
+        :param dict key_schemas: Optional avro schema for key per topic name,
+                                 takes precedence over ``default_key_schema``
+        :param dict value_schemas: Optional avro schema for value per topic name,
+                                   takes precedence over ``default_value_schema``
     """
 
     def __init__(self, config, default_key_schema=None,
-                 default_value_schema=None, schema_registry=None):
+                 default_value_schema=None, schema_registry=None,
+                 key_schemas=None, value_schemas=None):
 
         sr_conf = {key.replace("schema.registry.", ""): value
                    for key, value in config.items() if key.startswith("schema.registry")}
@@ -45,10 +50,12 @@ class AvroProducer(Producer):
         elif sr_conf.get("url", None) is not None:
             raise ValueError("Cannot pass schema_registry along with schema.registry.url config")
 
-        super(AvroProducer, self).__init__(ap_conf)
+        Producer.__init__(self, ap_conf)
         self._serializer = MessageSerializer(schema_registry)
         self._key_schema = default_key_schema
         self._value_schema = default_value_schema
+        self._key_schemas = {} if key_schemas is None else key_schemas
+        self._value_schemas = {} if value_schemas is None else value_schemas
 
     def produce(self, **kwargs):
         """
@@ -56,9 +63,9 @@ class AvroProducer(Producer):
 
             :param str topic: topic name
             :param object value: An object to serialize
-            :param str value_schema: Avro schema for value
+            :param str value_schema: Avro schema for value (default: topic's or default value schema)
             :param object key: An object to serialize
-            :param str key_schema: Avro schema for key
+            :param str key_schema: Avro schema for key (default: topic's or default key schema)
 
             Plus any other parameters accepted by confluent_kafka.Producer.produce
 
@@ -66,28 +73,87 @@ class AvroProducer(Producer):
             :raises BufferError: If producer queue is full.
             :raises KafkaException: For other produce failures.
         """
-        # get schemas from  kwargs if defined
-        key_schema = kwargs.pop('key_schema', self._key_schema)
-        value_schema = kwargs.pop('value_schema', self._value_schema)
+        key_schema = kwargs.pop('key_schema', None)
+        value_schema = kwargs.pop('value_schema', None)
         topic = kwargs.pop('topic', None)
         if not topic:
             raise ClientError("Topic name not specified.")
         value = kwargs.pop('value', None)
         key = kwargs.pop('key', None)
 
+        if value is None and key is None:
+            # Nothing to encode, hand straight to the base producer
+            return Producer.produce(self, topic, value, key, **kwargs)
+
+        # get schemas from kwargs if defined, else the topic's or the default schemas
+        if value_schema is None:
+            value_schema = self._value_schemas.get(topic, self._value_schema)
+        if key_schema is None:
+            key_schema = self._key_schemas.get(topic, self._key_schema)
+
+        encode_record_with_schema = self._serializer.encode_record_with_schema
+
         if value is not None:
             if value_schema:
-                value = self._serializer.encode_record_with_schema(topic, value_schema, value)
+                value = encode_record_with_schema(topic, value_schema, value)
             else:
                 raise ValueSerializerError("Avro schema required for values")
 
         if key is not None:
             if key_schema:
-                key = self._serializer.encode_record_with_schema(topic, key_schema, key, True)
+                key = encode_record_with_schema(topic, key_schema, key, True)
             else:
                 raise KeySerializerError("Avro schema required for key")
 
-        super(AvroProducer, self).produce(topic, value, key, **kwargs)
+        Producer.produce(self, topic, value, key, **kwargs)
+
+    def produce_many(self, topic, values, keys=None, *args, **kwargs):
+        """
+            Asynchronously sends a batch of messages to Kafka by encoding with specified or default avro schema.
+            The schemas are resolved and registered once for the whole batch.
+
+            :param str topic: topic name
+            :param iterable values: Objects to serialize
+            :param str value_schema: Avro schema for values (default: topic's or default value schema)
+            :param iterable keys: Objects to serialize, must be as many as values
+            :param str key_schema: Avro schema for keys (default: topic's or default key schema)
+
+            Plus any other parameters accepted by confluent_kafka.Producer.produce_many,
+            in the same positional order
+
+            :returns: Number of messages enqueued
+            :rtype: int
+            :raises SerializerError: On serialization failure
+            :raises BufferError: If producer queue is full.
+            :raises KafkaException: For other produce failures.
+        """
+        key_schema = kwargs.pop('key_schema', None)
+        value_schema = kwargs.pop('value_schema', None)
+        if not topic:
+            raise ClientError("Topic name not specified.")
+
+        # Iterators would be consumed by the None checks below
+        values = list(values)
+        if keys is not None:
+            keys = list(keys)
+
+        encode_records_with_schema = self._serializer.encode_records_with_schema
+
+        if any(value is not None for value in values):
+            if value_schema is None:
+                value_schema = self._value_schemas.get(topic, self._value_schema)
+            if not value_schema:
+                raise ValueSerializerError("Avro schema required for values")
+            values = encode_records_with_schema(topic, value_schema, values)
+
+        if keys is not None and any(key is not None for key in keys):
+            if key_schema is None:
+                key_schema = self._key_schemas.get(topic, self._key_schema)
+            if not key_schema:
+                raise KeySerializerError("Avro schema required for key")
+            keys = encode_records_with_schema(topic, key_schema, keys, True)
+
+        return Producer.produce_many(self, topic, values, keys, *args, **kwargs)
 
 
 class AvroConsumer(Consumer):
@@ -95,16 +161,28 @@ class AvroConsumer(Consumer):
     Kafka Consumer client which does avro schema decoding of messages.
     Handles message deserialization.
 
+    Messages are fetched from the brokers by librdkafka's background threads
+    while the application is decoding, up to ``queued.min.messages`` /
+    ``queued.max.messages.kbytes`` ahead of the application. For throughput
+    bound by decoding, prefer :py:func:`consume()` or :py:func:`consume_batch()`
+    over :py:func:`poll()` to decode messages in batches, and raise these properties if the fetch
+    queue runs dry between calls.
+
     Constructor takes below parameters
 
     :param dict config: Config parameters containing url for schema registry (``schema.registry.url``)
                         and the standard Kafka client configuration (``bootstrap.servers`` et.al)
     :param schema reader_key_schema: a reader schema for the message key
     :param schema reader_value_schema: a reader schema for the message value
+    :param dict reader_key_schemas: Optional reader schema for the message key per topic name,
+                                    takes precedence over ``reader_key_schema``
+    :param dict reader_value_schemas: Optional reader schema for the message value per topic name,
+                                      takes precedence over ``reader_value_schema``
     :raises ValueError: For invalid configurations
     """
 
-    def __init__(self, config, schema_registry=None, reader_key_schema=None, reader_value_schema=None):
+    def __init__(self, config, schema_registry=None, reader_key_schema=None, reader_value_schema=None,
+                 reader_key_schemas=None, reader_value_schemas=None):
 
         sr_conf = {key.replace("schema.registry.", ""): value
                    for key, value in config.items() if key.startswith("schema.registry")}
@@ -122,8 +200,13 @@ class AvroConsumer(Consumer):
         elif sr_conf.get("url", None) is not None:
             raise ValueError("Cannot pass schema_registry along with schema.registry.url config")
 
-        super(AvroConsumer, self).__init__(ap_conf)
+        Consumer.__init__(self, ap_conf)
         self._serializer = MessageSerializer(schema_registry, reader_key_schema, reader_value_schema)
+        self._reader_key_schemas = {} if reader_key_schemas is None else reader_key_schemas
+        self._reader_value_schemas = {} if reader_value_schemas is None else reader_value_schemas
+        # Decoders are cached by writer schema id only, so topics with their
+        # own reader schemas are decoded by their own serializer.
+        self._topic_serializers = {}
 
     def poll(self, timeout=None):
         """
@@ -136,22 +219,202 @@ class AvroConsumer(Consumer):
         """
         if timeout is None:
             timeout = -1
-        message = super(AvroConsumer, self).poll(timeout)
+        message = Consumer.poll(self, timeout)
         if message is None:
             return None
 
         if not message.error():
-            try:
-                if message.value() is not None:
-                    decoded_value = self._serializer.decode_message(message.value(), is_key=False)
-                    message.set_value(decoded_value)
-                if message.key() is not None:
-                    decoded_key = self._serializer.decode_message(message.key(), is_key=True)
-                    message.set_key(decoded_key)
-            except SerializerError as e:
-                raise SerializerError("Message deserialization failed for message at {} [{}] offset {}: {}".format(
-                    message.topic(),
-                    message.partition(),
-                    message.offset(),
-                    e))
+            self._decode_message(message)
         return message
+
+    def consume(self, num_messages=1, timeout=None):
+        """
+        This is an overriden method from confluent_kafka.Consumer class. This handles
+        deserialization of a batch of messages using avro schema
+
+        If a message can't be decoded the rest of the batch is still decoded, and
+        SerializerError is raised with the whole batch attached so no message is lost:
+        ``messages`` is the list of messages that would have been returned and ``failed``
+        the indexes in ``messages`` of those left undecoded (raw key and value).
+
+        :param int num_messages: Maximum number of messages to return (default: 1)
+        :param float timeout: Maximum time to block waiting for messages (default: indefinite)
+        :returns: list of message objects with deserialized key and value as dict objects
+        :rtype: list(Message)
+        :raises SerializerError: If any message fails to deserialize
+        """
+        if timeout is None:
+            timeout = -1
+        messages = Consumer.consume(self, num_messages, timeout)
+
+        valid = [message for message in messages if not message.error()]
+        if not valid:
+            return messages
+
+        if self._reader_key_schemas or self._reader_value_schemas:
+            # Decode each topic's messages with that topic's reader schemas
+            batches = {}
+            for message in valid:
+                batches.setdefault(self._get_serializer(message.topic()), []).append(message)
+            errors = {}
+            for serializer, batch in batches.items():
+                errors.update(self._decode_messages(serializer, batch))
+        else:
+            errors = self._decode_messages(self._serializer, valid)
+
+        if errors:
+            failed = [i for i, message in enumerate(messages) if id(message) in errors]
+            error = errors[id(messages[failed[0]])]
+            error.messages = messages
+            error.failed = failed
+            raise error
+        return messages
+
+    def consume_batch(self, num_messages=1, timeout=None):
+        """
+        This is an overriden method from confluent_kafka.Consumer class. This handles
+        deserialization of the batch's keys and values using avro schema
+
+        If a message can't be decoded SerializerError is raised as with :py:func:`consume()`,
+        with ``messages`` set to the batch and ``failed`` to the indexes of the entries
+        left undecoded.
+
+        :param int num_messages: Maximum number of messages to return (default: 1)
+        :param float timeout: Maximum time to block waiting for messages (default: indefinite)
+        :returns: batch of messages with deserialized keys and values as dict objects
+        :rtype: MessageBatch
+        :raises SerializerError: If any message fails to deserialize
+        """
+        if timeout is None:
+            timeout = -1
+        batch = Consumer.consume_batch(self, num_messages, timeout)
+
+        errors = batch.errors
+        if self._reader_key_schemas or self._reader_value_schemas:
+            # Decode each topic's messages with that topic's reader schemas
+            groups = {}
+            for i, topic in enumerate(batch.topics):
+                if errors[i] is None:
+                    groups.setdefault(self._get_serializer(topic), []).append(i)
+        else:
+            valid = [i for i, error in enumerate(errors) if error is None]
+            groups = {self._serializer: valid} if valid else {}
+
+        failed = {}
+        for serializer, indexes in groups.items():
+            failed.update(self._decode_batch(serializer, batch, indexes))
+
+        if failed:
+            error = failed[min(failed)]
+            error.messages = batch
+            error.failed = sorted(failed)
+            raise error
+        return batch
+
+    def _get_serializer(self, topic):
+        if not self._reader_key_schemas and not self._reader_value_schemas:
+            return self._serializer
+
+        serializer = self._topic_serializers.get(topic)
+        if serializer is None:
+            if topic in self._reader_key_schemas or topic in self._reader_value_schemas:
+                serializer = MessageSerializer(self._serializer.registry_client,
+                                               self._reader_key_schemas.get(topic,
+                                                                            self._serializer.reader_key_schema),
+                                               self._reader_value_schemas.get(topic,
+                                                                              self._serializer.reader_value_schema))
+            else:
+                serializer = self._serializer
+            self._topic_serializers[topic] = serializer
+        return serializer
+
+    def _decode_messages(self, serializer, messages):
+        """
+        Decode messages in place, returns the SerializerError of each message
+        that failed to decode by message id(), such messages are left as is.
+        """
+        raw_values = [message.value() for message in messages]
+        raw_keys = [message.key() for message in messages]
+
+        decode_messages = serializer.decode_messages
+        try:
+            values = decode_messages(raw_values, is_key=False)
+            keys = decode_messages(raw_keys, is_key=True)
+        except Exception:
+            # Decode the messages one by one to find the offending messages,
+            # a corrupt payload may fail with any error from the avro decoders
+            errors = {}
+            for message in messages:
+                try:
+                    self._decode_message(message)
+                except SerializerError as e:
+                    errors[id(message)] = e
+            return errors
+
+        # A payload may decode to None (e.g. a null union branch),
+        # so go by the raw payload as _decode_message() does.
+        for message, raw_value, value, raw_key, key in zip(messages, raw_values, values, raw_keys, keys):
+            if raw_value is not None:
+                message.set_value(value)
+            if raw_key is not None:
+                message.set_key(key)
+        return {}
+
+    def _decode_batch(self, serializer, batch, indexes):
+        """
+        Decode the batch's entries at indexes in place, returns the SerializerError
+        of each entry that failed to decode by index, such entries are left as is.
+        """
+        keys = batch.keys
+        values = batch.values
+
+        decode_messages = serializer.decode_messages
+        try:
+            decoded_values = decode_messages([values[i] for i in indexes], is_key=False)
+            decoded_keys = decode_messages([keys[i] for i in indexes], is_key=True)
+        except Exception:
+            # Decode the entries one by one to find the offending entries,
+            # a corrupt payload may fail with any error from the avro decoders
+            errors = {}
+            decode_message = serializer.decode_message
+            for i in indexes:
+                try:
+                    value = decode_message(values[i], is_key=False)
+                    key = decode_message(keys[i], is_key=True)
+                except Exception as e:
+                    errors[i] = SerializerError(
+                        "Message deserialization failed for message at {} [{}] offset {}: {}".format(
+                            batch.topics[i],
+                            batch.partitions[i],
+                            batch.offsets[i],
+                            e if isinstance(e, SerializerError) else repr(e)))
+                    continue
+                values[i] = value
+                keys[i] = key
+            return errors
+
+        for i, value, key in zip(indexes, decoded_values, decoded_keys):
+            values[i] = value
+            keys[i] = key
+        return {}
+
+    def _decode_message(self, message):
+        decode_message = self._get_serializer(message.topic()).decode_message
+        try:
+            value = message.value()
+            if value is not None:
+                value = decode_message(value, is_key=False)
+            key = message.key()
+            if key is not None:
+                key = decode_message(key, is_key=True)
+        except Exception as e:
+            raise SerializerError("Message deserialization failed for message at {} [{}] offset {}: {}".format(
+                message.topic(),
+                message.partition(),
+                message.offset(),
+                e if isinstance(e, SerializerError) else repr(e)))
+        # Only update the message once both decoded, it's left raw on failure
+        if message.value() is not None:
+            message.set_value(value)
+        if message.key() is not None:
+            message.set_key(key)
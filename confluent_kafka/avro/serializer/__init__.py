@@ -20,16 +20,17 @@ class SerializerError(Exception):
     """Generic error from serializer package"""
 
     def __init__(self, message):
+        super(SerializerError, self).__init__(message)
         self.message = message
 
-        def __repr__(self):
-            return '{klass}(error={error})'.format(
-                klass=self.__class__.__name__,
-                error=self.message
-            )
+    def __repr__(self):
+        return '{klass}(error={error})'.format(
+            klass=self.__class__.__name__,
+            error=self.message
+        )
 
-        def __str__(self):
-            return self.message
+    def __str__(self):
+        return self.message
 
 
 class KeySerializerError(SerializerError):
@@ -45,6 +45,13 @@ try:
 except ImportError:
     pass
 
+try:
+    # Parsing the schema up front spares fastavro from parsing it on every call
+    from fastavro import parse_schema
+except ImportError:
+    def parse_schema(schema):
+        return schema
+
 
 class ContextStringIO(io.BytesIO):
     """
@@ -78,7 +85,7 @@ class MessageSerializer(object):
     # Encoder support
     def _get_encoder_func(self, writer_schema):
         if HAS_FAST:
-            schema = writer_schema.to_json()
+            schema = parse_schema(writer_schema.to_json())
             return lambda record, fp: schemaless_writer(fp, schema, record)
         writer = avro.io.DatumWriter(writer_schema)
         return lambda record, fp: writer.write(record, avro.io.BinaryEncoder(fp))
@@ -96,6 +103,30 @@ class MessageSerializer(object):
         :returns: Encoded record with schema ID as bytes
         :rtype: bytes
         """
+        schema_id = self._register_schema(topic, schema, is_key)
+
+        return self.encode_record_with_schema_id(schema_id, record, is_key=is_key)
+
+    def encode_records_with_schema(self, topic, schema, records, is_key=False):
+        """
+        Given a parsed avro schema, encode a batch of records for the given
+        topic. The schema is registered once for the whole batch.
+
+        The schema is registered with the subject of 'topic-value'
+        :param str topic: Topic name
+        :param schema schema: Avro Schema
+        :param list records: Objects to serialize, None entries are kept as None
+        :param bool is_key: If the records are keys
+        :returns: Encoded records with schema ID as bytes, in the order of ``records``
+        :rtype: list(bytes)
+        """
+        schema_id = self._register_schema(topic, schema, is_key)
+
+        encode_record_with_schema_id = self.encode_record_with_schema_id
+        return [None if record is None else encode_record_with_schema_id(schema_id, record, is_key=is_key)
+                for record in records]
+
+    def _register_schema(self, topic, schema, is_key):
         serialize_err = KeySerializerError if is_key else ValueSerializerError
 
         subject_suffix = ('-key' if is_key else '-value')
@@ -107,10 +138,11 @@ class MessageSerializer(object):
             message = "Unable to retrieve schema id for subject %s" % (subject)
             raise serialize_err(message)
 
-        # cache writer
-        self.id_to_writers[schema_id] = self._get_encoder_func(schema)
+        # cache writer, building it is more expensive than encoding a record
+        if schema_id not in self.id_to_writers:
+            self.id_to_writers[schema_id] = self._get_encoder_func(schema)
 
-        return self.encode_record_with_schema_id(schema_id, record, is_key=is_key)
+        return schema_id
 
     def encode_record_with_schema_id(self, schema_id, record, is_key=False):
         """
@@ -169,8 +201,8 @@ class MessageSerializer(object):
         if HAS_FAST:
             # try to use fast avro
             try:
-                writer_schema = writer_schema_obj.to_json()
-                reader_schema = reader_schema_obj.to_json()
+                writer_schema = parse_schema(writer_schema_obj.to_json())
+                reader_schema = parse_schema(reader_schema_obj.to_json()) if reader_schema_obj else None
                 schemaless_reader(payload, writer_schema)
 
                 # If we reach this point, this means we have fastavro and it can
@@ -208,7 +240,9 @@ class MessageSerializer(object):
         """
         Decode a message from kafka that has been encoded for use with
         the schema registry.
-        :param str|bytes or None message: message key or value to be decoded
+        :param str|bytes or None message: message key or value to be decoded,
+                                          any object supporting the buffer protocol
+                                          (e.g. ``bytearray``, ``memoryview``) is accepted
         :returns: Decoded message contents.
         :rtype dict:
         """
@@ -219,9 +253,50 @@ class MessageSerializer(object):
         if len(message) <= 5:
             raise SerializerError("message is too small to decode")
 
+        # Parse the header in place rather than reading it out of the
+        # payload stream, the stream then skips past it.
+        magic, schema_id = struct.unpack_from('>bI', message)
+        if magic != MAGIC_BYTE:
+            raise SerializerError("message does not start with magic byte")
+
         with ContextStringIO(message) as payload:
-            magic, schema_id = struct.unpack('>bI', payload.read(5))
-            if magic != MAGIC_BYTE:
-                raise SerializerError("message does not start with magic byte")
+            payload.seek(5)
             decoder_func = self._get_decoder_func(schema_id, payload, is_key)
             return decoder_func(payload)
+
+    def decode_messages(self, messages, is_key=False):
+        """
+        Decode a batch of messages from kafka that have been encoded for use
+        with the schema registry. Consecutive messages written with the same
+        schema share a single decoder lookup.
+        :param list messages: message keys or values (str|bytes or None) to be decoded
+        :param bool is_key: If the messages are keys
+        :returns: Decoded message contents, in the order of ``messages``.
+        :rtype list:
+        """
+
+        decoded = []
+        append = decoded.append
+        last_schema_id = None
+        decoder_func = None
+
+        for message in messages:
+            if message is None:
+                append(None)
+                continue
+
+            if len(message) <= 5:
+                raise SerializerError("message is too small to decode")
+
+            magic, schema_id = struct.unpack_from('>bI', message)
+            if magic != MAGIC_BYTE:
+                raise SerializerError("message does not start with magic byte")
+
+            with ContextStringIO(message) as payload:
+                payload.seek(5)
+                if schema_id != last_schema_id:
+                    decoder_func = self._get_decoder_func(schema_id, payload, is_key)
+                    last_schema_id = schema_id
+                append(decoder_func(payload))
+
+        return decoded
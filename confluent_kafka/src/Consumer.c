@@ -908,33 +908,23 @@ static PyObject *Consumer_poll (Handle *self, PyObject *args,
 }
 
 
-static PyObject *Consumer_consume (Handle *self, PyObject *args,
-                                        PyObject *kwargs) {
-        unsigned int num_messages = 1;
-        double tmout = -1.0f;
-        static char *kws[] = { "num_messages", "timeout", NULL };
+/**
+ * @brief Fetch up to \p num_messages messages from the consumer queue,
+ *        blocking at most \p tmout seconds (-1 for infinite).
+ *
+ * @returns the number of messages fetched into \p *rkmessagesp, or -1 on
+ *          error in which case a Python exception has been raised.
+ *          On success the caller must destroy the messages and free()
+ *          \p *rkmessagesp.
+ */
+static Py_ssize_t Consumer_consume0 (Handle *self, unsigned int num_messages,
+                                     double tmout,
+                                     rd_kafka_message_t ***rkmessagesp) {
         rd_kafka_message_t **rkmessages;
-        PyObject *msglist;
         rd_kafka_queue_t *rkqu = self->u.Consumer.rkqu;
         CallState cs;
         Py_ssize_t i, n;
 
-        if (!self->rk) {
-                PyErr_SetString(PyExc_RuntimeError,
-                                "Consumer closed");
-                return NULL;
-        }
-
-        if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|Id", kws,
-					 &num_messages, &tmout))
-		return NULL;
-
-	if (num_messages > 1000000) {
-	        PyErr_SetString(PyExc_ValueError,
-	                        "num_messages must be between 0 and 1000000 (1M)");
-	        return NULL;
-	}
-
         CallState_begin(self, &cs);
 
         rkmessages = malloc(num_messages * sizeof(rd_kafka_message_t *));
@@ -949,16 +939,51 @@ static PyObject *Consumer_consume (Handle *self, PyObject *args,
                         rd_kafka_message_destroy(rkmessages[i]);
                 }
                 free(rkmessages);
-                return NULL;
+                return -1;
         }
 
         if (n < 0) {
                 free(rkmessages);
                 cfl_PyErr_Format(rd_kafka_last_error(),
                                  "%s", rd_kafka_err2str(rd_kafka_last_error()));
+                return -1;
+        }
+
+        *rkmessagesp = rkmessages;
+
+        return n;
+}
+
+
+static PyObject *Consumer_consume (Handle *self, PyObject *args,
+                                        PyObject *kwargs) {
+        unsigned int num_messages = 1;
+        double tmout = -1.0f;
+        static char *kws[] = { "num_messages", "timeout", NULL };
+        rd_kafka_message_t **rkmessages;
+        PyObject *msglist;
+        Py_ssize_t i, n;
+
+        if (!self->rk) {
+                PyErr_SetString(PyExc_RuntimeError,
+                                "Consumer closed");
                 return NULL;
         }
 
+        if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|Id", kws,
+					 &num_messages, &tmout))
+		return NULL;
+
+	if (num_messages > 1000000) {
+	        PyErr_SetString(PyExc_ValueError,
+	                        "num_messages must be between 0 and 1000000 (1M)");
+	        return NULL;
+	}
+
+        n = Consumer_consume0(self, num_messages, tmout, &rkmessages);
+        if (n < 0)
+                return NULL;
+
         msglist = PyList_New(n);
 
         for (i = 0; i < n; i++) {
@@ -978,6 +1003,137 @@ static PyObject *Consumer_consume (Handle *self, PyObject *args,
 }
 
 
+static PyObject *Consumer_consume_batch (Handle *self, PyObject *args,
+                                         PyObject *kwargs) {
+        unsigned int num_messages = 1;
+        double tmout = -1.0f;
+        static char *kws[] = { "num_messages", "timeout", NULL };
+        rd_kafka_message_t **rkmessages;
+        PyObject *MessageBatch_type, *batch;
+        PyObject *topics, *partitions, *offsets, *timestamps;
+        PyObject *timestamp_types, *keys, *values, *errors;
+        const rd_kafka_topic_t *last_rkt = NULL;
+        PyObject *topic = NULL;
+        Py_ssize_t i, n;
+
+        if (!self->rk) {
+                PyErr_SetString(PyExc_RuntimeError,
+                                "Consumer closed");
+                return NULL;
+        }
+
+        if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|Id", kws,
+					 &num_messages, &tmout))
+		return NULL;
+
+	if (num_messages > 1000000) {
+	        PyErr_SetString(PyExc_ValueError,
+	                        "num_messages must be between 0 and 1000000 (1M)");
+	        return NULL;
+	}
+
+        /* Look up the result type before consuming so that messages
+         * are not lost if the lookup fails. */
+        MessageBatch_type = cfl_PyObject_lookup("confluent_kafka",
+                                                "MessageBatch");
+        if (!MessageBatch_type)
+                return NULL;
+
+        n = Consumer_consume0(self, num_messages, tmout, &rkmessages);
+        if (n < 0) {
+                Py_DECREF(MessageBatch_type);
+                return NULL;
+        }
+
+        topics     = PyList_New(n);
+        partitions = PyList_New(n);
+        offsets    = PyList_New(n);
+        timestamps = PyList_New(n);
+        timestamp_types = PyList_New(n);
+        keys       = PyList_New(n);
+        values     = PyList_New(n);
+        errors     = PyList_New(n);
+
+        for (i = 0; i < n; i++) {
+                const rd_kafka_message_t *rkm = rkmessages[i];
+                rd_kafka_timestamp_type_t tstype;
+                PyObject *o;
+
+                /* Batches are usually made up of runs of messages from
+                 * the same topic, share the topic object between them. */
+                if (!topic || rkm->rkt != last_rkt) {
+                        Py_XDECREF(topic);
+                        if (rkm->rkt)
+                                topic = cfl_PyUnistr_InternFromString(
+                                        rd_kafka_topic_name(rkm->rkt));
+                        else {
+                                topic = Py_None;
+                                Py_INCREF(topic);
+                        }
+                        last_rkt = rkm->rkt;
+                }
+                Py_INCREF(topic);
+                PyList_SET_ITEM(topics, i, topic);
+
+                PyList_SET_ITEM(partitions, i,
+                                cfl_PyInt_FromInt(rkm->partition));
+                PyList_SET_ITEM(offsets, i, PyLong_FromLongLong(rkm->offset));
+                PyList_SET_ITEM(timestamps, i,
+                                PyLong_FromLongLong(
+                                        rd_kafka_message_timestamp(rkm,
+                                                                   &tstype)));
+                PyList_SET_ITEM(timestamp_types, i,
+                                cfl_PyInt_FromInt(tstype));
+
+                if (rkm->key)
+                        o = cfl_PyBin(_FromStringAndSize(rkm->key,
+                                                         rkm->key_len));
+                else {
+                        o = Py_None;
+                        Py_INCREF(o);
+                }
+                PyList_SET_ITEM(keys, i, o);
+
+                if (rkm->payload)
+                        o = cfl_PyBin(_FromStringAndSize(rkm->payload,
+                                                         rkm->len));
+                else {
+                        o = Py_None;
+                        Py_INCREF(o);
+                }
+                PyList_SET_ITEM(values, i, o);
+
+                PyList_SET_ITEM(errors, i,
+                                KafkaError_new_or_None(
+                                        rkm->err,
+                                        rkm->err ?
+                                        rd_kafka_message_errstr(rkm) : NULL));
+
+                rd_kafka_message_destroy(rkmessages[i]);
+        }
+
+        Py_XDECREF(topic);
+        free(rkmessages);
+
+        batch = PyObject_CallFunctionObjArgs(MessageBatch_type,
+                                             topics, partitions, offsets,
+                                             timestamps, timestamp_types,
+                                             keys, values, errors, NULL);
+
+        Py_DECREF(topics);
+        Py_DECREF(partitions);
+        Py_DECREF(offsets);
+        Py_DECREF(timestamps);
+        Py_DECREF(timestamp_types);
+        Py_DECREF(keys);
+        Py_DECREF(values);
+        Py_DECREF(errors);
+        Py_DECREF(MessageBatch_type);
+
+        return batch;
+}
+
+
 static PyObject *Consumer_close (Handle *self, PyObject *ignore) {
         CallState cs;
 
@@ -1090,6 +1246,34 @@ static PyMethodDef Consumer_methods[] = {
           "  :raises ValueError: if num_messages > 1M\n"
 	  "\n"
 	},
+	{ "consume_batch", (PyCFunction)Consumer_consume_batch,
+	  METH_VARARGS|METH_KEYWORDS,
+	  ".. py:function:: consume_batch([num_messages=1], [timeout=-1])\n"
+	  "\n"
+	  "  Consume messages, calls callbacks and returns the messages as a "
+	  ":py:class:`MessageBatch` of parallel lists (possibly empty on timeout).\n"
+	  "\n"
+	  "  This is the same as :py:func:`consume()` but avoids creating a "
+	  ":py:class:`Message` object per message, which is useful when "
+	  "handing keys or values to a batch deserializer.\n"
+	  "  Message headers are not included in the batch.\n"
+	  "\n"
+	  "  The application must check the returned batch's ``errors`` list "
+	  "to distinguish between proper messages (``None``), or an event or "
+	  "error for each entry of the batch.\n"
+	  "\n"
+	  "  .. note: Callbacks may be called from this method, "
+	  "such as ``on_assign``, ``on_revoke``, et.al.\n"
+	  "\n"
+	  "  :param int num_messages: Maximum number of messages to return (default: 1).\n"
+	  "  :param float timeout: Maximum time to block waiting for message, event or callback (default: infinite (-1)). (Seconds)\n"
+	  "  :returns: A MessageBatch object (possibly empty on timeout)\n"
+	  "  :rtype: :py:class:`MessageBatch`\n"
+          "  :raises RuntimeError: if called on a closed consumer\n"
+          "  :raises KafkaError: in case of internal error\n"
+          "  :raises ValueError: if num_messages > 1M\n"
+	  "\n"
+	},
 	{ "assign", (PyCFunction)Consumer_assign, METH_O,
 	  ".. py:function:: assign(partitions)\n"
 	  "\n"
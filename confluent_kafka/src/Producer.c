@@ -229,13 +229,17 @@ Producer_produce0 (Handle *self,
 
 static PyObject *Producer_produce (Handle *self, PyObject *args,
 				       PyObject *kwargs) {
-	const char *topic, *value = NULL, *key = NULL;
-	int value_len = 0, key_len = 0;
+	const char *topic;
+	/* value and key are any buffer-protocol object (bytes, str,
+	 * bytearray, memoryview, ..) referenced in place, librdkafka
+	 * makes the one copy of the data (RD_KAFKA_MSG_F_COPY). */
+	Py_buffer value = { NULL }, key = { NULL };
 	int partition = RD_KAFKA_PARTITION_UA;
 	PyObject *headers = NULL, *dr_cb = NULL, *dr_cb2 = NULL;
         long long timestamp = 0;
         rd_kafka_resp_err_t err;
 	struct Producer_msgstate *msgstate;
+	PyObject *result = NULL;
 #ifdef RD_KAFKA_V_HEADERS
     rd_kafka_headers_t *rd_headers = NULL;
 #endif
@@ -251,10 +255,10 @@ static PyObject *Producer_produce (Handle *self, PyObject *args,
 			       NULL };
 
 	if (!PyArg_ParseTupleAndKeywords(args, kwargs,
-					 "s|z#z#iOOLO"
+					 "s|z*z*iOOLO"
                                          , kws,
-					 &topic, &value, &value_len,
-					 &key, &key_len, &partition,
+					 &topic, &value,
+					 &key, &partition,
 					 &dr_cb, &dr_cb2,
                      &timestamp, &headers))
 		return NULL;
@@ -267,7 +271,7 @@ static PyObject *Producer_produce (Handle *self, PyObject *args,
                              "version >=v0.9.4 (librdkafka runtime 0x%x, "
                              "buildtime 0x%x)",
                              rd_kafka_version(), RD_KAFKA_VERSION);
-                return NULL;
+                goto done;
         }
 #endif
 
@@ -279,12 +283,12 @@ static PyObject *Producer_produce (Handle *self, PyObject *args,
                          "version >=v0.11.4 (librdkafka runtime 0x%x, "
                          "buildtime 0x%x)",
                          rd_kafka_version(), RD_KAFKA_VERSION);
-            return NULL;
+            goto done;
     }
 #else
     if (headers) {
         if(!(rd_headers = py_headers_to_c(headers)))
-            return NULL;
+            goto done;
     }
 #endif
 
@@ -302,8 +306,8 @@ static PyObject *Producer_produce (Handle *self, PyObject *args,
         /* Produce message */
 #if HAVE_PRODUCEV
         err = Producer_producev(self, topic, partition,
-                                value, value_len,
-                                key, key_len,
+                                value.buf, (size_t)value.len,
+                                key.buf, (size_t)key.len,
                                 msgstate, timestamp
 #ifdef RD_KAFKA_V_HEADERS
                                 ,rd_headers
@@ -311,8 +315,8 @@ static PyObject *Producer_produce (Handle *self, PyObject *args,
                                 );
 #else
         err = Producer_produce0(self, topic, partition,
-                                value, value_len,
-                                key, key_len,
+                                value.buf, (size_t)value.len,
+                                key.buf, (size_t)key.len,
                                 msgstate);
 #endif
 
@@ -328,10 +332,218 @@ static PyObject *Producer_produce (Handle *self, PyObject *args,
 					 "Unable to produce message: %s",
 					 rd_kafka_err2str(err));
 
+		goto done;
+	}
+
+#ifdef RD_KAFKA_V_HEADERS
+	/* The message now owns the headers */
+	rd_headers = NULL;
+#endif
+
+	Py_INCREF(Py_None);
+	result = Py_None;
+
+ done:
+#ifdef RD_KAFKA_V_HEADERS
+	/* librdkafka only takes ownership of the headers on success */
+	if (rd_headers)
+		rd_kafka_headers_destroy(rd_headers);
+#endif
+	PyBuffer_Release(&key);
+	PyBuffer_Release(&value);
+
+	return result;
+}
+
+
+/**
+ * @brief Get the optional per-message \p obj sequence of produce_many(),
+ *        which must have as many items as values (\p cnt).
+ *
+ * @returns 1 with a new reference in \p seqp (NULL if not set),
+ *          or 0 if an exception was raised.
+ */
+static int Producer_produce_many_seq (PyObject *obj, const char *name,
+                                      Py_ssize_t cnt, PyObject **seqp) {
+	char errstr[64];
+
+	*seqp = NULL;
+
+	if (!obj || obj == Py_None)
+		return 1;
+
+	snprintf(errstr, sizeof(errstr), "expected %s to be a sequence", name);
+	if (!(*seqp = PySequence_Fast(obj, errstr)))
+		return 0;
+
+	if (PySequence_Fast_GET_SIZE(*seqp) != cnt) {
+		PyErr_Format(PyExc_ValueError,
+			     "%s and values must be of the same length", name);
+		Py_DECREF(*seqp);
+		*seqp = NULL;
+		return 0;
+	}
+
+	return 1;
+}
+
+
+static PyObject *Producer_produce_many (Handle *self, PyObject *args,
+                                        PyObject *kwargs) {
+	const char *topic;
+	PyObject *values, *keys = NULL, *partitions = NULL, *timestamps = NULL;
+	PyObject *values_seq, *keys_seq = NULL;
+	PyObject *partitions_seq = NULL, *timestamps_seq = NULL;
+	int partition = RD_KAFKA_PARTITION_UA;
+	PyObject *dr_cb = NULL, *dr_cb2 = NULL;
+        long long timestamp = 0;
+        rd_kafka_resp_err_t err = RD_KAFKA_RESP_ERR_NO_ERROR;
+	Py_ssize_t i, cnt;
+
+	static char *kws[] = { "topic",
+			       "values",
+			       "keys",
+			       "partition",
+			       "callback",
+			       "on_delivery", /* Alias */
+			       "timestamp",
+			       "partitions",
+			       "timestamps",
+			       NULL };
+
+	if (!PyArg_ParseTupleAndKeywords(args, kwargs,
+					 "sO|OiOOLOO", kws,
+					 &topic, &values, &keys, &partition,
+					 &dr_cb, &dr_cb2, &timestamp,
+					 &partitions, &timestamps))
+		return NULL;
+
+	if (partitions && partitions != Py_None &&
+	    partition != RD_KAFKA_PARTITION_UA) {
+		PyErr_SetString(PyExc_ValueError,
+				"partition and partitions are mutually "
+				"exclusive");
 		return NULL;
 	}
 
-	Py_RETURN_NONE;
+	if (timestamps && timestamps != Py_None && timestamp) {
+		PyErr_SetString(PyExc_ValueError,
+				"timestamp and timestamps are mutually "
+				"exclusive");
+		return NULL;
+	}
+
+#if !HAVE_PRODUCEV
+        if (timestamp || (timestamps && timestamps != Py_None)) {
+                PyErr_Format(PyExc_NotImplementedError,
+                             "Producer timestamps require "
+                             "confluent-kafka-python built for librdkafka "
+                             "version >=v0.9.4 (librdkafka runtime 0x%x, "
+                             "buildtime 0x%x)",
+                             rd_kafka_version(), RD_KAFKA_VERSION);
+                return NULL;
+        }
+#endif
+
+	if (!(values_seq = PySequence_Fast(values,
+					   "expected values to be a sequence")))
+		return NULL;
+
+	cnt = PySequence_Fast_GET_SIZE(values_seq);
+
+	if (!Producer_produce_many_seq(keys, "keys", cnt, &keys_seq) ||
+	    !Producer_produce_many_seq(partitions, "partitions", cnt,
+				       &partitions_seq) ||
+	    !Producer_produce_many_seq(timestamps, "timestamps", cnt,
+				       &timestamps_seq)) {
+		Py_XDECREF(keys_seq);
+		Py_XDECREF(partitions_seq);
+		Py_DECREF(values_seq);
+		return NULL;
+	}
+
+	if (dr_cb2 && !dr_cb) /* Alias */
+		dr_cb = dr_cb2;
+
+	if (!dr_cb || dr_cb == Py_None)
+		dr_cb = self->u.Producer.default_dr_cb;
+
+	for (i = 0 ; i < cnt ; i++) {
+		Py_buffer value = { NULL }, key = { NULL };
+		struct Producer_msgstate *msgstate;
+
+		/* Same argument conversion as produce() */
+		if ((partitions_seq &&
+		     !PyArg_Parse(PySequence_Fast_GET_ITEM(partitions_seq, i),
+				  "i", &partition)) ||
+		    (timestamps_seq &&
+		     !PyArg_Parse(PySequence_Fast_GET_ITEM(timestamps_seq, i),
+				  "L", &timestamp)))
+			break;
+
+		if (!PyArg_Parse(PySequence_Fast_GET_ITEM(values_seq, i),
+				 "z*", &value))
+			break;
+
+		if (keys_seq &&
+		    !PyArg_Parse(PySequence_Fast_GET_ITEM(keys_seq, i),
+				 "z*", &key)) {
+			PyBuffer_Release(&value);
+			break;
+		}
+
+		msgstate = Producer_msgstate_new(self, dr_cb);
+
+#if HAVE_PRODUCEV
+		err = Producer_producev(self, topic, partition,
+					value.buf, (size_t)value.len,
+					key.buf, (size_t)key.len,
+					msgstate, timestamp
+#ifdef RD_KAFKA_V_HEADERS
+					,NULL
+#endif
+					);
+#else
+		err = Producer_produce0(self, topic, partition,
+					value.buf, (size_t)value.len,
+					key.buf, (size_t)key.len,
+					msgstate);
+#endif
+
+		PyBuffer_Release(&key);
+		PyBuffer_Release(&value);
+
+		if (err) {
+			Producer_msgstate_destroy(msgstate);
+			break;
+		}
+	}
+
+	Py_XDECREF(timestamps_seq);
+	Py_XDECREF(partitions_seq);
+	Py_XDECREF(keys_seq);
+	Py_DECREF(values_seq);
+
+	if (i == cnt)
+		return PyLong_FromSsize_t(i);
+
+	if (err == RD_KAFKA_RESP_ERR__QUEUE_FULL) {
+		/* Retryable: report how many messages were enqueued,
+		 * the application will poll() and produce the remaining
+		 * messages. */
+		if (i > 0)
+			return PyLong_FromSsize_t(i);
+
+		PyErr_Format(PyExc_BufferError,
+			     "%s", rd_kafka_err2str(err));
+	} else if (err)
+		cfl_PyErr_Format(err,
+				 "Unable to produce message: %s",
+				 rd_kafka_err2str(err));
+
+	/* else: value or key conversion failed, exception already raised */
+
+	return NULL;
 }
 
 
@@ -416,8 +628,8 @@ static PyMethodDef Producer_methods[] = {
       "had headers set.\n"
 	  "\n"
 	  "  :param str topic: Topic to produce message to\n"
-	  "  :param str|bytes value: Message payload\n"
-	  "  :param str|bytes key: Message key\n"
+	  "  :param str|bytes|bytearray|memoryview value: Message payload\n"
+	  "  :param str|bytes|bytearray|memoryview key: Message key\n"
 	  "  :param int partition: Partition to produce to, else uses the "
 	  "configured built-in partitioner.\n"
 	  "  :param func on_delivery(err,msg): Delivery report callback to call "
@@ -425,7 +637,7 @@ static PyMethodDef Producer_methods[] = {
 	  "failed delivery\n"
           "  :param int timestamp: Message timestamp (CreateTime) in milliseconds since epoch UTC (requires librdkafka >= v0.9.4, api.version.request=true, and broker >= 0.10.0.0). Default value is current time.\n"
 	  "\n"
-          "  :param headers dict|list: Message headers to set on the message. The header key must be a string while the value must be binary, unicode or None. Accepts a list of (key,value) or a dict. (Requires librdkafka >= v0.11.4 and broker version >= 0.11.0.0)\n"
+          "  :param headers dict|list: Message headers to set on the message. The header key must be a string while the value must be binary, unicode or None. Accepts a list of (key,value) or a dict, or a :py:class:`PreparedHeaders` object to reuse the same headers across messages. (Requires librdkafka >= v0.11.4 and broker version >= 0.11.0.0)\n"
 	  "  :rtype: None\n"
 	  "  :raises BufferError: if the internal producer message queue is "
 	  "full (``queue.buffering.max.messages`` exceeded)\n"
@@ -434,6 +646,53 @@ static PyMethodDef Producer_methods[] = {
 	  "\n"
 	},
 
+	{ "produce_many", (PyCFunction)Producer_produce_many,
+	  METH_VARARGS|METH_KEYWORDS,
+	  ".. py:function:: produce_many(topic, values, [keys], [partition], [on_delivery], [timestamp], [partitions], [timestamps])\n"
+	  "\n"
+	  "  Produce a batch of messages to topic.\n"
+	  "  This is equivalent to calling :py:func:`produce()` for each "
+	  "value (and key) in order, but enqueues all the messages in a "
+	  "single call.\n"
+	  "\n"
+	  "  If the internal producer message queue fills up, no further "
+	  "messages are enqueued and the number of messages enqueued so far "
+	  "is returned. The application should then :py:func:`poll()` and "
+	  "produce the remaining messages. BufferError is only raised if "
+	  "the first message can't be enqueued.\n"
+	  "\n"
+	  "  Any other error is raised, the messages preceding the "
+	  "offending one remain enqueued.\n"
+	  "\n"
+	  "  :param str topic: Topic to produce messages to\n"
+	  "  :param list(str|bytes|bytearray|memoryview) values: Message payloads\n"
+	  "  :param list(str|bytes|bytearray|memoryview) keys: Message keys, must be as many as values\n"
+	  "  :param int partition: Partition to produce all messages to, else "
+	  "uses the configured built-in partitioner.\n"
+	  "  :param func on_delivery(err,msg): Delivery report callback to call "
+	  "(from :py:func:`poll()` or :py:func:`flush()`) on successful or "
+	  "failed delivery of each message\n"
+          "  :param int timestamp: Message timestamp (CreateTime) in milliseconds since epoch UTC to set on all messages (requires librdkafka >= v0.9.4, api.version.request=true, and broker >= 0.10.0.0). Default value is current time.\n"
+	  "  :param list(int) partitions: Partition of each message, must be "
+	  "as many as values. Mutually exclusive with ``partition``.\n"
+	  "  :param list(int) timestamps: Timestamp of each message, as for "
+	  "``timestamp``, must be as many as values. Mutually exclusive with "
+	  "``timestamp``.\n"
+	  "\n"
+	  "  :returns: Number of messages enqueued\n"
+	  "  :rtype: int\n"
+	  "  :raises BufferError: if the internal producer message queue is "
+	  "full (``queue.buffering.max.messages`` exceeded)\n"
+	  "  :raises KafkaException: for other errors, see exception code\n"
+	  "  :raises TypeError: if a value or key is not None, str or a "
+	  "buffer-protocol object (bytes, bytearray, memoryview, ..), "
+	  "or a partition or timestamp is not an int\n"
+	  "  :raises ValueError: if keys, partitions or timestamps and values "
+	  "are not of the same length\n"
+          "  :raises NotImplementedError: if timestamp is specified without underlying library support.\n"
+	  "\n"
+	},
+
 	{ "poll", (PyCFunction)Producer_poll, METH_VARARGS|METH_KEYWORDS,
 	  ".. py:function:: poll([timeout])\n"
 	  "\n"
@@ -669,9 +669,11 @@ PyObject *Message_new0 (const Handle *handle, const rd_kafka_message_t *rkm) {
                 (rkm->err && handle->type != RD_KAFKA_PRODUCER) ?
                 rd_kafka_message_errstr(rkm) : NULL);
 
+	/* Topic names repeat across messages: intern them so they are
+	 * shared and hash/compare cheaply when used as dict keys. */
 	if (rkm->rkt)
-		self->topic = cfl_PyUnistr(
-			_FromString(rd_kafka_topic_name(rkm->rkt)));
+		self->topic = cfl_PyUnistr_InternFromString(
+			rd_kafka_topic_name(rkm->rkt));
 	if (rkm->payload)
 		self->value = cfl_PyBin(_FromStringAndSize(rkm->payload,
 							   rkm->len));
@@ -1148,7 +1150,19 @@ static rd_kafka_headers_t *py_headers_dict_to_c (PyObject *hdrs) {
  */
 rd_kafka_headers_t *py_headers_to_c (PyObject *hdrs) {
 
-        if (PyList_Check(hdrs)) {
+        if (PyObject_TypeCheck(hdrs, &PreparedHeadersType)) {
+                PreparedHeaders *ph = (PreparedHeaders *)hdrs;
+
+                if (!ph->c_headers) {
+                        PyErr_SetString(PyExc_ValueError,
+                                        "PreparedHeaders not initialized");
+                        return NULL;
+                }
+
+                /* Already converted: the message takes ownership of
+                 * its headers, so hand it a copy of the prepared ones. */
+                return rd_kafka_headers_copy(ph->c_headers);
+        } else if (PyList_Check(hdrs)) {
                 return py_headers_list_to_c(hdrs);
         } else if (PyDict_Check(hdrs)) {
                 return py_headers_dict_to_c(hdrs);
@@ -1201,6 +1215,124 @@ PyObject *c_headers_to_py (rd_kafka_headers_t *headers) {
 #endif
 
 
+/****************************************************************************
+ *
+ *
+ * PreparedHeaders
+ *
+ *
+ *
+ *
+ ****************************************************************************/
+static void PreparedHeaders_clear (PreparedHeaders *self) {
+#ifdef RD_KAFKA_V_HEADERS
+	if (self->c_headers) {
+		rd_kafka_headers_destroy(self->c_headers);
+		self->c_headers = NULL;
+	}
+#endif
+}
+
+
+static void PreparedHeaders_dealloc (PreparedHeaders *self) {
+	PreparedHeaders_clear(self);
+
+	Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+
+static int PreparedHeaders_init (PyObject *self, PyObject *args,
+				 PyObject *kwargs) {
+	PyObject *headers;
+	static char *kws[] = { "headers", NULL };
+
+	if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O", kws, &headers))
+		return -1;
+
+#ifndef RD_KAFKA_V_HEADERS
+	PyErr_Format(PyExc_NotImplementedError,
+		     "PreparedHeaders requires "
+		     "confluent-kafka-python built for librdkafka "
+		     "version >=v0.11.4 (librdkafka runtime 0x%x, "
+		     "buildtime 0x%x)",
+		     rd_kafka_version(), RD_KAFKA_VERSION);
+	return -1;
+#else
+	PreparedHeaders_clear((PreparedHeaders *)self);
+
+	if (!(((PreparedHeaders *)self)->c_headers =
+	      py_headers_to_c(headers)))
+		return -1;
+
+	return 0;
+#endif
+}
+
+
+static PyObject *PreparedHeaders_new (PyTypeObject *type, PyObject *args,
+				      PyObject *kwargs) {
+	PyObject *self = type->tp_alloc(type, 1);
+	return self;
+}
+
+
+PyTypeObject PreparedHeadersType = {
+	PyVarObject_HEAD_INIT(NULL, 0)
+	"cimpl.PreparedHeaders",   /*tp_name*/
+	sizeof(PreparedHeaders),   /*tp_basicsize*/
+	0,                         /*tp_itemsize*/
+	(destructor)PreparedHeaders_dealloc, /*tp_dealloc*/
+	0,                         /*tp_print*/
+	0,                         /*tp_getattr*/
+	0,                         /*tp_setattr*/
+	0,                         /*tp_compare*/
+	0,                         /*tp_repr*/
+	0,                         /*tp_as_number*/
+	0,                         /*tp_as_sequence*/
+	0,                         /*tp_as_mapping*/
+	0,                         /*tp_hash */
+	0,                         /*tp_call*/
+	0,                         /*tp_str*/
+	PyObject_GenericGetAttr,   /*tp_getattro*/
+	0,                         /*tp_setattro*/
+	0,                         /*tp_as_buffer*/
+	Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE, /*tp_flags*/
+	"PreparedHeaders holds message headers converted once, up front, "
+	"for use with any number of messages.\n"
+	"\n"
+	"Passing a PreparedHeaders object as the ``headers`` argument of "
+	":py:func:`Producer.produce()` spares converting the same headers "
+	"again for every message.\n"
+	"\n"
+	".. py:function:: PreparedHeaders(headers)\n"
+	"\n"
+	"  Instantiate a PreparedHeaders object.\n"
+	"\n"
+	"  :param headers dict|list: Message headers, as accepted by "
+	":py:func:`Producer.produce()`. (Requires librdkafka >= v0.11.4)\n"
+	"  :rtype: PreparedHeaders\n"
+	"\n"
+	"\n", /*tp_doc*/
+	0,                         /* tp_traverse */
+	0,                         /* tp_clear */
+	0,                         /* tp_richcompare */
+	0,		           /* tp_weaklistoffset */
+	0,		           /* tp_iter */
+	0,		           /* tp_iternext */
+	0,                         /* tp_methods */
+	0,                         /* tp_members */
+	0,                         /* tp_getset */
+	0,                         /* tp_base */
+	0,                         /* tp_dict */
+	0,                         /* tp_descr_get */
+	0,                         /* tp_descr_set */
+	0,                         /* tp_dictoffset */
+	PreparedHeaders_init,      /* tp_init */
+	0,                         /* tp_alloc */
+	PreparedHeaders_new        /* tp_new */
+};
+
+
 /****************************************************************************
  *
  *
@@ -1939,7 +2071,7 @@ PyObject *cfl_PyObject_lookup (const char *modulename, const char *typename) {
         PyObject *module = PyImport_ImportModule(modulename);
         PyObject *obj;
 
-        if (!modulename) {
+        if (!module) {
                 PyErr_Format(PyExc_TypeError,
                              "Module %s not found when looking up %s.%s",
                              modulename, modulename, typename);
@@ -1947,8 +2079,8 @@ PyObject *cfl_PyObject_lookup (const char *modulename, const char *typename) {
         }
 
         obj = PyObject_GetAttrString(module, typename);
+        Py_DECREF(module);
         if (!obj) {
-                Py_DECREF(module);
                 PyErr_Format(PyExc_TypeError,
                              "No such class/type/object: %s.%s",
                              modulename, typename);
@@ -2286,6 +2418,8 @@ static PyObject *_init_cimpl (void) {
 		return NULL;
 	if (PyType_Ready(&TopicPartitionType) < 0)
 		return NULL;
+	if (PyType_Ready(&PreparedHeadersType) < 0)
+		return NULL;
 	if (PyType_Ready(&ProducerType) < 0)
 		return NULL;
 	if (PyType_Ready(&ConsumerType) < 0)
@@ -2317,6 +2451,10 @@ static PyObject *_init_cimpl (void) {
 	PyModule_AddObject(m, "TopicPartition",
 			   (PyObject *)&TopicPartitionType);
 
+	Py_INCREF(&PreparedHeadersType);
+	PyModule_AddObject(m, "PreparedHeaders",
+			   (PyObject *)&PreparedHeadersType);
+
 	Py_INCREF(&ProducerType);
 	PyModule_AddObject(m, "Producer", (PyObject *)&ProducerType);
 
@@ -120,6 +120,12 @@ cfl_PyUnistr_AsUTF8 (PyObject *o, PyObject **uobjp) {
  */
 #define cfl_PyObject_Unistr(X)  PyObject_Str(X)
 
+/**
+ * @returns Interned Unicode Python string object for C string \p S,
+ *          repeated values share the same object.
+ */
+#define cfl_PyUnistr_InternFromString(S) PyUnicode_InternFromString(S)
+
 #else /* Python 2 */
 
 /* See comments above */
@@ -150,6 +156,8 @@ cfl_PyUnistr_AsUTF8 (PyObject *o, PyObject **uobjp) {
         return PyBytes_AsString(*uobjp);
 }
 #define cfl_PyObject_Unistr(X) PyObject_Unicode(X)
+/* Unicode objects can't be interned on Python 2 */
+#define cfl_PyUnistr_InternFromString(S) PyUnicode_FromString(S)
 #endif
 
 
@@ -355,6 +363,30 @@ rd_kafka_headers_t *py_headers_to_c (PyObject *hdrs);
 PyObject *c_headers_to_py (rd_kafka_headers_t *headers);
 #endif
 
+
+/****************************************************************************
+ *
+ *
+ * PreparedHeaders
+ *
+ *
+ *
+ *
+ ****************************************************************************/
+
+/**
+ * @brief confluent_kafka.PreparedHeaders object: headers converted once
+ *        and copied onto each message they are produced with.
+ */
+typedef struct {
+	PyObject_HEAD
+#ifdef RD_KAFKA_V_HEADERS
+	rd_kafka_headers_t *c_headers;
+#endif
+} PreparedHeaders;
+
+extern PyTypeObject PreparedHeadersType;
+
 /****************************************************************************
  *
  *
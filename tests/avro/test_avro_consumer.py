@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+#
+# Copyright 2016 Confluent Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import os
+import unittest
+
+import confluent_kafka.avro
+from confluent_kafka import avro, MessageBatch
+from confluent_kafka.avro import AvroConsumer, ClientError
+from confluent_kafka.avro.serializer import SerializerError, message_serializer
+
+from tests.avro import data_gen
+from tests.avro.mock_schema_registry_client import MockSchemaRegistryClient
+
+
+avsc_dir = os.path.dirname(os.path.realpath(__file__))
+
+
+class StubMessage(object):
+    """ Stands in for a consumed confluent_kafka.Message """
+
+    def __init__(self, value=None, key=None, error=None, offset=0, topic='test'):
+        self._value = value
+        self._key = key
+        self._error = error
+        self._offset = offset
+        self._topic = topic
+
+    def value(self):
+        return self._value
+
+    def set_value(self, value):
+        self._value = value
+
+    def key(self):
+        return self._key
+
+    def set_key(self, key):
+        self._key = key
+
+    def error(self):
+        return self._error
+
+    def topic(self):
+        return self._topic
+
+    def partition(self):
+        return 0
+
+    def offset(self):
+        return self._offset
+
+
+class TestAvroConsumer(unittest.TestCase):
+
+    def setUp(self):
+        self.client = MockSchemaRegistryClient()
+        self.consumer = AvroConsumer({'group.id': 'test'}, schema_registry=self.client)
+        self.serializer = self.consumer._serializer
+
+    def tearDown(self):
+        self.consumer.close()
+
+    def consume(self, messages, consumer=None):
+        """ Run AvroConsumer.consume() over messages returned by a stubbed base Consumer.consume() """
+        if consumer is None:
+            consumer = self.consumer
+
+        class StubConsumer(object):
+            @staticmethod
+            def consume(consumer, num_messages, timeout):
+                return messages
+
+        base = confluent_kafka.avro.Consumer
+        confluent_kafka.avro.Consumer = StubConsumer
+        try:
+            return consumer.consume(len(messages), 0)
+        finally:
+            confluent_kafka.avro.Consumer = base
+
+    def consume_batch(self, entries, consumer=None):
+        """ Run AvroConsumer.consume_batch() over (topic, key, value, error) entries
+            returned by a stubbed base Consumer.consume_batch() """
+        if consumer is None:
+            consumer = self.consumer
+
+        n = len(entries)
+        batch = MessageBatch([e[0] for e in entries], [0] * n, list(range(n)), [-1] * n, [0] * n,
+                             [e[1] for e in entries], [e[2] for e in entries], [e[3] for e in entries])
+
+        class StubConsumer(object):
+            @staticmethod
+            def consume_batch(consumer, num_messages, timeout):
+                return batch
+
+        base = confluent_kafka.avro.Consumer
+        confluent_kafka.avro.Consumer = StubConsumer
+        try:
+            return consumer.consume_batch(n, 0)
+        finally:
+            confluent_kafka.avro.Consumer = base
+
+    def test_consume(self):
+        basic_id = self.client.register('test-value', avro.loads(data_gen.BASIC_SCHEMA))
+        record = data_gen.create_basic_item(1)
+        encoded = self.serializer.encode_record_with_schema_id(basic_id, record)
+
+        error = StubMessage(value=b'raw error payload', error='an error')
+        messages = [StubMessage(value=encoded, key=encoded, offset=1),
+                    error,
+                    StubMessage(value=encoded, offset=2)]
+
+        result = self.consume(messages)
+        self.assertIs(result, messages)
+        self.assertEqual(messages[0].value(), record)
+        self.assertEqual(messages[0].key(), record)
+        self.assertEqual(messages[2].value(), record)
+        self.assertIsNone(messages[2].key())
+        # Error messages are left as is
+        self.assertEqual(error.value(), b'raw error payload')
+
+        self.assertEqual(self.consume([error]), [error])
+
+    def test_consume_null_value(self):
+        schema_id = self.client.register('test-value', avro.loads('["null", "string"]'))
+        encoded = self.serializer.encode_record_with_schema_id(schema_id, None)
+        message = StubMessage(value=encoded, key=encoded)
+
+        self.consume([message])
+        self.assertIsNone(message.value())
+        self.assertIsNone(message.key())
+
+    def test_consume_invalid(self):
+        basic_id = self.client.register('test-value', avro.loads(data_gen.BASIC_SCHEMA))
+        record = data_gen.create_basic_item(1)
+        encoded = self.serializer.encode_record_with_schema_id(basic_id, record)
+        invalid = b'\x01\x00\x00\x00\x01\x02'
+        messages = [StubMessage(value=encoded, offset=1),
+                    StubMessage(value=invalid, offset=2),
+                    StubMessage(value=encoded, key=invalid, offset=3),
+                    StubMessage(value=encoded, offset=4)]
+
+        with self.assertRaises(SerializerError) as ctx:
+            self.consume(messages)
+        self.assertIn('message at test [0] offset 2', str(ctx.exception))
+
+        # The good messages are decoded and handed back with the error
+        self.assertIs(ctx.exception.messages, messages)
+        self.assertEqual(ctx.exception.failed, [1, 2])
+        self.assertEqual(messages[0].value(), record)
+        self.assertEqual(messages[3].value(), record)
+        # Failed messages are left raw
+        self.assertEqual(messages[1].value(), invalid)
+        self.assertEqual(messages[2].value(), encoded)
+        self.assertEqual(messages[2].key(), invalid)
+
+    def test_consume_truncated(self):
+        basic_id = self.client.register('test-value', avro.loads(data_gen.BASIC_SCHEMA))
+        record = data_gen.create_basic_item(1)
+        encoded = self.serializer.encode_record_with_schema_id(basic_id, record)
+        # Valid header, corrupt body
+        truncated = encoded[:8]
+        messages = [StubMessage(value=encoded, offset=1),
+                    StubMessage(value=truncated, offset=2),
+                    StubMessage(value=encoded, offset=3)]
+
+        with self.assertRaises(SerializerError) as ctx:
+            self.consume(messages)
+        self.assertIn('message at test [0] offset 2', str(ctx.exception))
+
+        self.assertIs(ctx.exception.messages, messages)
+        self.assertEqual(ctx.exception.failed, [1])
+        self.assertEqual(messages[0].value(), record)
+        self.assertEqual(messages[1].value(), truncated)
+        self.assertEqual(messages[2].value(), record)
+
+    def test_consume_transient_error(self):
+        basic_id = self.client.register('test-value', avro.loads(data_gen.BASIC_SCHEMA))
+        record = data_gen.create_basic_item(1)
+        encoded = self.serializer.encode_record_with_schema_id(basic_id, record)
+        messages = [StubMessage(value=encoded, offset=1),
+                    StubMessage(value=encoded, offset=2)]
+
+        get_by_id = self.client.get_by_id
+        calls = []
+
+        def flaky_get_by_id(schema_id):
+            calls.append(schema_id)
+            if len(calls) == 1:
+                raise ClientError("Registry unavailable")
+            return get_by_id(schema_id)
+
+        self.client.get_by_id = flaky_get_by_id
+
+        # The messages decode on retry, so the batch is returned
+        self.assertIs(self.consume(messages), messages)
+        self.assertEqual(messages[0].value(), record)
+        self.assertEqual(messages[1].value(), record)
+
+    @unittest.skipUnless(message_serializer.HAS_FAST, "requires fastavro")
+    def test_consume_with_topic_reader_schemas(self):
+        user_v1 = avro.load(os.path.join(avsc_dir, "user_v1.avsc"))
+        user_v2 = avro.load(os.path.join(avsc_dir, "user_v2.avsc"))
+        schema_id = self.client.register('test-value', user_v1)
+        encoded = self.serializer.encode_record_with_schema_id(schema_id, {'name': 'abc'})
+
+        consumer = AvroConsumer({'group.id': 'test'}, schema_registry=self.client,
+                                reader_value_schemas={'evolved': user_v2})
+        try:
+            messages = [StubMessage(value=encoded, topic='test'),
+                        StubMessage(value=encoded, topic='evolved')]
+            self.consume(messages, consumer)
+        finally:
+            consumer.close()
+
+        self.assertEqual(messages[0].value(), {'name': 'abc'})
+        self.assertEqual(messages[1].value(), {'name': 'abc', 'favorite_number': None, 'favorite_color': None})
+
+    def test_consume_batch(self):
+        basic_id = self.client.register('test-value', avro.loads(data_gen.BASIC_SCHEMA))
+        record = data_gen.create_basic_item(1)
+        encoded = self.serializer.encode_record_with_schema_id(basic_id, record)
+
+        batch = self.consume_batch([('test', encoded, encoded, None),
+                                    ('test', None, b'raw error payload', 'an error'),
+                                    ('test', None, encoded, None)])
+        self.assertEqual(batch.values, [record, b'raw error payload', record])
+        self.assertEqual(batch.keys, [record, None, None])
+
+    def test_consume_batch_invalid(self):
+        basic_id = self.client.register('test-value', avro.loads(data_gen.BASIC_SCHEMA))
+        record = data_gen.create_basic_item(1)
+        encoded = self.serializer.encode_record_with_schema_id(basic_id, record)
+        invalid = b'\x01\x00\x00\x00\x01\x02'
+
+        with self.assertRaises(SerializerError) as ctx:
+            self.consume_batch([('test', None, encoded, None),
+                                ('test', None, invalid, None),
+                                ('test', None, encoded, None)])
+        self.assertIn('message at test [0] offset 1', str(ctx.exception))
+
+        # The good messages are decoded and handed back with the error
+        batch = ctx.exception.messages
+        self.assertEqual(ctx.exception.failed, [1])
+        self.assertEqual(batch.values, [record, invalid, record])
+
+    def test_consume_batch_truncated(self):
+        basic_id = self.client.register('test-value', avro.loads(data_gen.BASIC_SCHEMA))
+        record = data_gen.create_basic_item(1)
+        encoded = self.serializer.encode_record_with_schema_id(basic_id, record)
+        # Valid header, corrupt body
+        truncated = encoded[:8]
+
+        with self.assertRaises(SerializerError) as ctx:
+            self.consume_batch([('test', None, encoded, None),
+                                ('test', truncated, encoded, None),
+                                ('test', None, encoded, None)])
+        self.assertIn('message at test [0] offset 1', str(ctx.exception))
+
+        batch = ctx.exception.messages
+        self.assertEqual(ctx.exception.failed, [1])
+        self.assertEqual(batch.values, [record, encoded, record])
+        self.assertEqual(batch.keys, [None, truncated, None])
+
+    @unittest.skipUnless(message_serializer.HAS_FAST, "requires fastavro")
+    def test_consume_batch_with_topic_reader_schemas(self):
+        user_v1 = avro.load(os.path.join(avsc_dir, "user_v1.avsc"))
+        user_v2 = avro.load(os.path.join(avsc_dir, "user_v2.avsc"))
+        schema_id = self.client.register('test-value', user_v1)
+        encoded = self.serializer.encode_record_with_schema_id(schema_id, {'name': 'abc'})
+
+        consumer = AvroConsumer({'group.id': 'test'}, schema_registry=self.client,
+                                reader_value_schemas={'evolved': user_v2})
+        try:
+            batch = self.consume_batch([('test', None, encoded, None),
+                                        ('evolved', None, encoded, None)], consumer)
+        finally:
+            consumer.close()
+
+        self.assertEqual(batch.values, [{'name': 'abc'},
+                                        {'name': 'abc', 'favorite_number': None, 'favorite_color': None}])
@@ -21,6 +21,7 @@
 #
 import os
 
+import confluent_kafka.avro
 from confluent_kafka import avro
 
 from requests.exceptions import ConnectionError
@@ -36,8 +37,29 @@ from tests.avro.mock_schema_registry_client import MockSchemaRegistryClient
 avsc_dir = os.path.dirname(os.path.realpath(__file__))
 
 
+class StubProducer(object):
+    """ Stands in for the base confluent_kafka.Producer, recording produce_many() calls """
+
+    batches = []
+
+    @classmethod
+    def produce_many(cls, producer, topic, values, keys=None, partition=-1, **kwargs):
+        cls.batches.append((topic, values, keys, partition))
+        return len(values)
+
+
 class TestAvroProducer(unittest.TestCase):
 
+    def produce_many(self, producer, *args, **kwargs):
+        """ Run AvroProducer.produce_many() against a stubbed base Producer.produce_many() """
+        StubProducer.batches = []
+        base = confluent_kafka.avro.Producer
+        confluent_kafka.avro.Producer = StubProducer
+        try:
+            return producer.produce_many(*args, **kwargs)
+        finally:
+            confluent_kafka.avro.Producer = base
+
     def test_instantiation(self):
         obj = AvroProducer({'schema.registry.url': 'http://127.0.0.1:0'})
         self.assertTrue(isinstance(obj, AvroProducer))
@@ -124,3 +146,77 @@ class TestAvroProducer(unittest.TestCase):
                                 default_key_schema=key_schema,
                                 default_value_schema=value_schema)
         producer.produce(topic='test', value=0.0, key='')
+
+    def test_produce_no_key_no_value(self):
+        schema_registry = MockSchemaRegistryClient()
+        producer = AvroProducer({}, schema_registry=schema_registry)
+        # Nothing to encode, no schema required
+        producer.produce(topic='test')
+        self.assertEqual(schema_registry.id_to_schema, {})
+
+    def test_produce_with_topic_schemas(self):
+        key_schema = avro.load(os.path.join(avsc_dir, "primitive_string.avsc"))
+        value_schema = avro.load(os.path.join(avsc_dir, "primitive_float.avsc"))
+        schema_registry = MockSchemaRegistryClient()
+        producer = AvroProducer({}, schema_registry=schema_registry,
+                                key_schemas={'test': key_schema},
+                                value_schemas={'test': value_schema})
+        producer.produce(topic='test', value=0.0, key='mykey')
+        self.assertEqual(schema_registry.get_latest_schema('test-value')[1], value_schema)
+        self.assertEqual(schema_registry.get_latest_schema('test-key')[1], key_schema)
+
+        with self.assertRaises(ValueSerializerError):
+            # No schema for this topic and no default schema
+            producer.produce(topic='other', value=0.0)
+
+    def test_produce_many(self):
+        key_schema = avro.load(os.path.join(avsc_dir, "primitive_string.avsc"))
+        value_schema = avro.load(os.path.join(avsc_dir, "primitive_float.avsc"))
+        schema_registry = MockSchemaRegistryClient()
+        producer = AvroProducer({}, schema_registry=schema_registry,
+                                default_key_schema=key_schema,
+                                default_value_schema=value_schema)
+        self.assertEqual(self.produce_many(producer, 'test', [0.0, 1.0, None], keys=['a', None, 'c']), 3)
+
+        topic, values, keys, partition = StubProducer.batches[0]
+        self.assertEqual(topic, 'test')
+        decode_messages = producer._serializer.decode_messages
+        self.assertEqual(decode_messages(values), [0.0, 1.0, None])
+        self.assertEqual(decode_messages(keys, is_key=True), ['a', None, 'c'])
+
+    def test_produce_many_generator(self):
+        value_schema = avro.load(os.path.join(avsc_dir, "primitive_float.avsc"))
+        schema_registry = MockSchemaRegistryClient()
+        producer = AvroProducer({}, schema_registry=schema_registry,
+                                default_value_schema=value_schema)
+        self.assertEqual(self.produce_many(producer, 'test', (v for v in [1.0, 2.0, 3.0]),
+                                           keys=(k for k in [None, None, None])), 3)
+
+        topic, values, keys, partition = StubProducer.batches[0]
+        self.assertEqual(producer._serializer.decode_messages(values), [1.0, 2.0, 3.0])
+        self.assertEqual(keys, [None, None, None])
+
+        # All None values need no schema and are passed through
+        producer = AvroProducer({}, schema_registry=schema_registry)
+        self.assertEqual(self.produce_many(producer, 'test', (v for v in [None, None])), 2)
+        self.assertEqual(StubProducer.batches[0][1], [None, None])
+
+    def test_produce_many_partition(self):
+        value_schema = avro.load(os.path.join(avsc_dir, "primitive_float.avsc"))
+        schema_registry = MockSchemaRegistryClient()
+        producer = AvroProducer({}, schema_registry=schema_registry,
+                                default_value_schema=value_schema)
+        # Positional arguments follow the base Producer.produce_many()
+        self.assertEqual(self.produce_many(producer, 'test', [1.0, 2.0], None, 3), 2)
+        topic, values, keys, partition = StubProducer.batches[0]
+        self.assertEqual(partition, 3)
+        self.assertEqual(producer._serializer.decode_messages(values), [1.0, 2.0])
+
+        self.assertEqual(self.produce_many(producer, 'test', [1.0], partition=1, value_schema=value_schema), 1)
+        self.assertEqual(StubProducer.batches[0][3], 1)
+
+    def test_produce_many_no_value_schema(self):
+        schema_registry = MockSchemaRegistryClient()
+        producer = AvroProducer({}, schema_registry=schema_registry)
+        with self.assertRaises(ValueSerializerError):
+            producer.produce_many('test', [{"name": 'abc"'}])
@@ -25,6 +25,8 @@ import struct
 import unittest
 
 from tests.avro import data_gen
+from confluent_kafka.avro.serializer import SerializerError
+from confluent_kafka.avro.serializer import message_serializer
 from confluent_kafka.avro.serializer.message_serializer import MessageSerializer
 from tests.avro.mock_schema_registry_client import MockSchemaRegistryClient
 from confluent_kafka import avro
@@ -75,10 +77,75 @@ class TestMessageSerializer(unittest.TestCase):
             message = self.ms.encode_record_with_schema(topic, basic, record)
             self.assertMessageIsSame(message, record, schema_id)
 
+    def test_encode_record_with_schema_caches_writer(self):
+        basic = avro.loads(data_gen.BASIC_SCHEMA)
+        schema_id = self.client.register('test-value', basic)
+        record = data_gen.create_basic_item(1)
+
+        self.ms.encode_record_with_schema('test', basic, record)
+        writer = self.ms.id_to_writers[schema_id]
+        message = self.ms.encode_record_with_schema('test', basic, record)
+        self.assertIs(self.ms.id_to_writers[schema_id], writer)
+        self.assertMessageIsSame(message, record, schema_id)
+
     def test_decode_none(self):
         """"null/None messages should decode to None"""
 
         self.assertIsNone(self.ms.decode_message(None))
 
+    def test_decode_messages(self):
+        adv = avro.loads(data_gen.ADVANCED_SCHEMA)
+        basic = avro.loads(data_gen.BASIC_SCHEMA)
+        basic_id = self.client.register('test', basic)
+        adv_id = self.client.register('test_adv', adv)
+
+        # BASIC_ITEMS/ADVANCED_ITEMS are one-shot iterators on Python 3,
+        # generate fresh records rather than exhausting them.
+        basic_records = [data_gen.create_basic_item(i) for i in range(1, 5)]
+        adv_records = [data_gen.create_adv_item(i) for i in range(1, 5)]
+        records = basic_records + adv_records
+        messages = [self.ms.encode_record_with_schema_id(basic_id, record) for record in basic_records]
+        messages += [self.ms.encode_record_with_schema_id(adv_id, record) for record in adv_records]
+
+        self.assertEqual(self.ms.decode_messages(messages + [None]), records + [None])
+        self.assertEqual(self.ms.decode_messages([]), [])
+
+    def test_decode_buffer(self):
+        basic = avro.loads(data_gen.BASIC_SCHEMA)
+        schema_id = self.client.register('test', basic)
+        record = data_gen.create_basic_item(1)
+        message = self.ms.encode_record_with_schema_id(schema_id, record)
+
+        self.assertEqual(self.ms.decode_message(bytearray(message)), record)
+        self.assertEqual(self.ms.decode_message(memoryview(message)), record)
+
+    def test_decode_invalid(self):
+        for message in (b'\x00\x00', b'\x01\x00\x00\x00\x01\x02'):
+            with self.assertRaises(SerializerError):
+                self.ms.decode_message(message)
+            with self.assertRaises(SerializerError) as ctx:
+                self.ms.decode_messages([None, message])
+            self.assertTrue(str(ctx.exception))
+
+        self.assertEqual(repr(SerializerError("oops")), "SerializerError(error=oops)")
+
+    @unittest.skipUnless(message_serializer.HAS_FAST, "requires fastavro")
+    def test_decode_with_fastavro(self):
+        """ Without a reader schema, messages must be decoded with fastavro, not avro """
+        basic = avro.loads(data_gen.BASIC_SCHEMA)
+        schema_id = self.client.register('test', basic)
+        record = data_gen.create_basic_item(1)
+        message = self.ms.encode_record_with_schema_id(schema_id, record)
+
+        def datum_reader(*args):
+            raise AssertionError("fell back to avro.io.DatumReader")
+
+        avro_datum_reader = message_serializer.avro.io.DatumReader
+        message_serializer.avro.io.DatumReader = datum_reader
+        try:
+            self.assertEqual(self.ms.decode_message(message), record)
+        finally:
+            message_serializer.avro.io.DatumReader = avro_datum_reader
+
     def hash_func(self):
         return hash(str(self))
@@ -45,6 +45,15 @@ def test_basic_api():
     msglist = kc.consume(num_messages=10, timeout=0.001)
     assert len(msglist) == 0, "expected 0 messages, not %d" % len(msglist)
 
+    batch = kc.consume_batch(num_messages=10, timeout=0.001)
+    assert len(batch) == 0, "expected 0 messages, not %d" % len(batch)
+    assert batch.values == [] and batch.errors == []
+    assert batch.timestamps == [] and batch.timestamp_types == []
+
+    with pytest.raises(ValueError) as ex:
+        kc.consume_batch(1000001)
+    assert 'num_messages must be between 0 and 1000000 (1M)' == str(ex.value)
+
     with pytest.raises(ValueError) as ex:
         kc.consume(-100)
     assert 'num_messages must be between 0 and 1000000 (1M)' == str(ex.value)
@@ -258,6 +267,10 @@ def test_any_method_after_close_throws_exception():
         c.consume()
     assert 'Consumer closed' == str(ex.value)
 
+    with pytest.raises(RuntimeError) as ex:
+        c.consume_batch()
+    assert 'Consumer closed' == str(ex.value)
+
     with pytest.raises(RuntimeError) as ex:
         c.assign([TopicPartition('test', 0)])
     assert 'Consumer closed' == str(ex.value)
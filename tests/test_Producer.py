@@ -1,8 +1,10 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import sys
+
 import pytest
 
-from confluent_kafka import Producer, KafkaError, KafkaException, libversion
+from confluent_kafka import Producer, KafkaError, KafkaException, PreparedHeaders, libversion
 from struct import pack
 
 
@@ -45,6 +47,96 @@ def test_basic_api():
         assert e.args[0].code() in (KafkaError._TIMED_OUT, KafkaError._TRANSPORT)
 
 
+def test_produce_many():
+    """ Test produce_many() """
+    p = Producer({'socket.timeout.ms': 10,
+                  'error_cb': error_cb,
+                  'message.timeout.ms': 10})
+
+    def on_delivery(err, msg):
+        # Since there is no broker, produced messages should time out.
+        assert err.code() == KafkaError._MSG_TIMED_OUT
+
+    assert p.produce_many('mytopic', []) == 0
+    assert p.produce_many('mytopic', ['somedata', b'more', None]) == 3
+    assert p.produce_many('mytopic', ['somedata', None], keys=['a key', None],
+                          partition=0, on_delivery=on_delivery) == 2
+    assert len(p) == 5
+
+    with pytest.raises(ValueError):
+        p.produce_many('mytopic', ['somedata'], keys=['a key', 'another key'])
+
+    # Per-message partitions and timestamps
+    assert p.produce_many('mytopic', ['somedata', 'more'], partitions=[0, 1],
+                          timestamps=[1234567, 1234568]) == 2
+    assert len(p) == 7
+
+    with pytest.raises(ValueError):
+        p.produce_many('mytopic', ['somedata'], partitions=[0, 1])
+
+    with pytest.raises(ValueError):
+        p.produce_many('mytopic', ['somedata'], partition=0, partitions=[0])
+
+    with pytest.raises(ValueError):
+        p.produce_many('mytopic', ['somedata'], timestamp=1234567, timestamps=[1234567])
+
+    with pytest.raises(TypeError):
+        p.produce_many('mytopic', ['somedata'], partitions=['0'])
+
+    with pytest.raises(TypeError):
+        p.produce_many('mytopic', 123)
+
+    with pytest.raises(TypeError):
+        p.produce_many('mytopic', [123])
+
+    # The messages preceding the invalid value remain enqueued
+    with pytest.raises(TypeError):
+        p.produce_many('mytopic', ['somedata', 123])
+    assert len(p) == 8
+
+    p.flush()
+
+
+def test_produce_buffers():
+    """ Test produce() and produce_many() with buffer-protocol values and keys """
+    p = Producer({'socket.timeout.ms': 10,
+                  'error_cb': error_cb,
+                  'message.timeout.ms': 10})
+
+    p.produce('mytopic', value=bytearray(b'somedata'), key=memoryview(b'a key'))
+    p.produce('mytopic', value=memoryview(bytearray(b'somedata')))
+    assert p.produce_many('mytopic', [bytearray(b'somedata'), memoryview(b'more')],
+                          keys=[memoryview(b'a key'), bytearray(b'another key')]) == 2
+    assert len(p) == 4
+
+    with pytest.raises(TypeError):
+        p.produce('mytopic', value=123)
+
+    p.flush()
+
+
+@pytest.mark.skipif(sys.version_info[0] < 3,
+                    reason="topic names are only interned on Python 3")
+def test_dr_msg_topic_interned():
+    """ Test that messages for the same topic share one topic object """
+    p = Producer({'socket.timeout.ms': 10,
+                  'error_cb': error_cb,
+                  'message.timeout.ms': 10})
+
+    topics = []
+
+    def on_delivery(err, msg):
+        topics.append(msg.topic())
+
+    p.produce('mytopic', value='somedata', on_delivery=on_delivery)
+    p.produce('mytopic', value='more', on_delivery=on_delivery)
+    p.flush()
+
+    assert len(topics) == 2
+    assert topics[0] == 'mytopic'
+    assert topics[0] is topics[1]
+
+
 def test_produce_timestamp():
     """ Test produce() with timestamp arg """
     p = Producer({'socket.timeout.ms': 10,
@@ -109,6 +201,30 @@ def test_produce_headers():
     p.flush()
 
 
+@pytest.mark.skipif(libversion()[1] < 0x000b0400,
+                    reason="requires librdkafka >=0.11.4")
+def test_produce_prepared_headers():
+    """ Test produce() with PreparedHeaders """
+    p = Producer({'socket.timeout.ms': 10,
+                  'error_cb': error_cb,
+                  'message.timeout.ms': 10})
+
+    for headers in ([('headerkey', 'headervalue'), ('key_with_null_value', None)],
+                    {'binaryval': pack('hhl', 1, 2, 3)}):
+        prepared = PreparedHeaders(headers)
+        # The prepared headers may be reused for any number of messages
+        p.produce('mytopic', value='somedata', key='a key', headers=prepared)
+        p.produce('mytopic', value='somedata', headers=prepared)
+
+    with pytest.raises(TypeError):
+        PreparedHeaders(('a', 'b'))
+
+    with pytest.raises(TypeError):
+        PreparedHeaders({'anint': 1234})
+
+    p.flush()
+
+
 # Should be updated to 0.11.4 when it is released
 @pytest.mark.skipif(libversion()[1] >= 0x000b0400,
                     reason="Old versions should fail when using headers")